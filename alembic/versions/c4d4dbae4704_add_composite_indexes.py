@@ -0,0 +1,80 @@
+"""add composite indexes for hot query paths
+
+Replaces the single-column FK indexes on conversations, messages and
+document_chunks with composite indexes matching the filter + sort order
+of the list/ownership/message queries.
+
+This is the root of the migration chain, but it does not create the
+schema: tables are created by ``init_db()`` (``SQLModel.metadata.create_all``)
+when the app starts. Revisions here only alter tables that already exist,
+so tables still missing are skipped, and ``create_all`` later builds them
+with the current indexes.
+
+Revision ID: c4d4dbae4704
+Revises:
+Create Date: 2026-10-14 10:12:31.402215
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import context, op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4d4dbae4704'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, new composite index, its columns, superseded single-column index)
+_INDEXES = [
+    (
+        "conversations",
+        "ix_conversations_user_id_created_at",
+        ["user_id", "created_at"],
+        "ix_conversations_user_id",
+    ),
+    (
+        "messages",
+        "ix_messages_conversation_id_created_at",
+        ["conversation_id", "created_at"],
+        "ix_messages_conversation_id",
+    ),
+    (
+        "document_chunks",
+        "ix_document_chunks_document_id_chunk_index",
+        ["document_id", "chunk_index"],
+        "ix_document_chunks_document_id",
+    ),
+]
+
+
+def _existing_tables() -> set[str] | None:
+    """Tables present in the target database, or None in offline (--sql) mode."""
+    if context.is_offline_mode():
+        return None
+    return set(sa.inspect(op.get_bind()).get_table_names())
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    tables = _existing_tables()
+    # if_not_exists / if_exists: tables may have been created by init_db()
+    # with either the old or the new set of indexes.
+    for table, name, columns, old_name in _INDEXES:
+        if tables is not None and table not in tables:
+            continue
+        op.create_index(name, table, columns, if_not_exists=True)
+        op.drop_index(old_name, table_name=table, if_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    tables = _existing_tables()
+    for table, name, columns, old_name in _INDEXES:
+        if tables is not None and table not in tables:
+            continue
+        op.create_index(old_name, table, [columns[0]], if_not_exists=True)
+        op.drop_index(name, table_name=table, if_exists=True)
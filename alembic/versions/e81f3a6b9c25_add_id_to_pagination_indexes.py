@@ -0,0 +1,71 @@
+"""add id tie-breaker to pagination indexes
+
+Keyset pagination over conversations and messages now orders by
+``(created_at, id)``; extend the composite indexes so the cursor
+predicate and sort stay a single index range scan.
+
+Like c4d4dbae4704, this assumes the tables were created by ``init_db()``
+and skips any that do not exist yet.
+
+Revision ID: e81f3a6b9c25
+Revises: c4d4dbae4704
+Create Date: 2026-10-14 15:40:08.517302
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import context, op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e81f3a6b9c25'
+down_revision: Union[str, Sequence[str], None] = 'c4d4dbae4704'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, new index, its columns, superseded (created_at)-only index)
+_INDEXES = [
+    (
+        "conversations",
+        "ix_conversations_user_id_created_at_id",
+        ["user_id", "created_at", "id"],
+        "ix_conversations_user_id_created_at",
+    ),
+    (
+        "messages",
+        "ix_messages_conversation_id_created_at_id",
+        ["conversation_id", "created_at", "id"],
+        "ix_messages_conversation_id_created_at",
+    ),
+]
+
+
+def _existing_tables() -> set[str] | None:
+    """Tables present in the target database, or None in offline (--sql) mode."""
+    if context.is_offline_mode():
+        return None
+    return set(sa.inspect(op.get_bind()).get_table_names())
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    tables = _existing_tables()
+    # if_not_exists / if_exists: tables may have been created by init_db()
+    # with either the old or the new set of indexes.
+    for table, name, columns, old_name in _INDEXES:
+        if tables is not None and table not in tables:
+            continue
+        op.create_index(name, table, columns, if_not_exists=True)
+        op.drop_index(old_name, table_name=table, if_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    tables = _existing_tables()
+    for table, name, columns, old_name in _INDEXES:
+        if tables is not None and table not in tables:
+            continue
+        op.create_index(old_name, table, columns[:-1], if_not_exists=True)
+        op.drop_index(name, table_name=table, if_exists=True)
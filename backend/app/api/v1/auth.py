@@ -1,5 +1,7 @@
 """Authentication endpoints — register & login."""
 
+import asyncio
+import uuid
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, status
@@ -33,7 +35,7 @@ class TokenResponse(BaseModel):
 
 
 class UserResponse(BaseModel):
-    id: str
+    id: uuid.UUID
     email: str
 
 
@@ -51,22 +53,23 @@ async def register(
 ) -> UserResponse:
     """Create a new user account."""
     # Check for existing email
-    result = await session.exec(select(User).where(User.email == body.email))
+    result = await session.exec(
+        select(User.id).where(User.email == body.email).limit(1)
+    )
     if result.first() is not None:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Email already registered",
         )
 
-    user = User(
-        email=body.email,
-        hashed_password=hash_password(body.password),
-    )
+    # password hashing is deliberately slow — keep it off the event loop
+    hashed_password = await asyncio.to_thread(hash_password, body.password)
+    user = User(email=body.email, hashed_password=hashed_password)
     session.add(user)
     await session.commit()
     await session.refresh(user)
 
-    return UserResponse(id=str(user.id), email=user.email)
+    return UserResponse(id=user.id, email=user.email)
 
 
 @router.post("/login", response_model=TokenResponse)
@@ -78,7 +81,9 @@ async def login(
     result = await session.exec(select(User).where(User.email == body.email))
     user = result.first()
 
-    if user is None or not verify_password(body.password, user.hashed_password):
+    if user is None or not await asyncio.to_thread(
+        verify_password, body.password, user.hashed_password
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid credentials",
@@ -1,19 +1,25 @@
 """Conversation & message endpoints."""
 
+import base64
 import uuid
+from datetime import datetime
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel
-from sqlmodel import select
+from sqlmodel import select, tuple_
 from sqlmodel.ext.asyncio.session import AsyncSession as SQLModelAsyncSession
 
-from app.core.deps import get_current_user
+from app.core.deps import CurrentUser, get_current_user
 from app.db.engine import get_session
-from app.db.models import Conversation, Message, User
+from app.db.models import Conversation, Message
 
 router = APIRouter(prefix="/conversations", tags=["conversations"])
 
+# Page size bounds for the keyset-paginated list endpoints
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
 
 # ── Schemas ──────────────────────────────────────────────────────
 
@@ -23,16 +29,26 @@ class ConversationCreate(BaseModel):
 
 
 class ConversationResponse(BaseModel):
-    id: str
+    id: uuid.UUID
     title: str
-    created_at: str
+    created_at: datetime
 
 
 class MessageResponse(BaseModel):
-    id: str
+    id: uuid.UUID
     role: str
     content: str
-    created_at: str
+    created_at: datetime
+
+
+class ConversationPage(BaseModel):
+    items: list[ConversationResponse]
+    next_cursor: str | None = None  # opaque; pass back as ``after``
+
+
+class MessagePage(BaseModel):
+    items: list[MessageResponse]
+    next_cursor: str | None = None  # opaque; pass back as ``after``
 
 
 class MessageCreate(BaseModel):
@@ -51,7 +67,7 @@ class MessageCreate(BaseModel):
 async def create_conversation(
     body: ConversationCreate,
     session: Annotated[SQLModelAsyncSession, Depends(get_session)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
 ) -> ConversationResponse:
     """Start a new conversation."""
     conv = Conversation(user_id=current_user.id, title=body.title)
@@ -59,46 +75,79 @@ async def create_conversation(
     await session.commit()
     await session.refresh(conv)
     return ConversationResponse(
-        id=str(conv.id),
+        id=conv.id,
         title=conv.title,
-        created_at=conv.created_at.isoformat(),
+        created_at=conv.created_at,
     )
 
 
-@router.get("/", response_model=list[ConversationResponse])
+@router.get("/", response_model=ConversationPage)
 async def list_conversations(
     session: Annotated[SQLModelAsyncSession, Depends(get_session)],
-    current_user: Annotated[User, Depends(get_current_user)],
-) -> list[ConversationResponse]:
-    """List all conversations for the current user."""
-    result = await session.exec(
-        select(Conversation)
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    after: str | None = None,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+) -> ConversationPage:
+    """List the current user's conversations, newest first.
+
+    Keyset-paginated: pass the previous page's ``next_cursor`` as *after*
+    to fetch the conversations created before it.
+    """
+    query = (
+        select(Conversation.id, Conversation.title, Conversation.created_at)
         .where(Conversation.user_id == current_user.id)
-        .order_by(Conversation.created_at.desc())  # type: ignore[union-attr]
+        .order_by(
+            Conversation.created_at.desc(),  # type: ignore[union-attr]
+            Conversation.id.desc(),  # type: ignore[union-attr]
+        )
+        .limit(limit + 1)  # one extra row tells us whether a next page exists
     )
-    return [
+    if after is not None:
+        query = query.where(
+            tuple_(Conversation.created_at, Conversation.id)
+            < tuple_(*_decode_cursor(after))
+        )
+
+    rows = (await session.exec(query)).all()
+    items = [
         ConversationResponse(
-            id=str(c.id),
-            title=c.title,
-            created_at=c.created_at.isoformat(),
+            id=conv_id,
+            title=title,
+            created_at=created_at,
         )
-        for c in result.all()
+        for conv_id, title, created_at in rows[:limit]
     ]
+    return ConversationPage(
+        items=items,
+        next_cursor=(
+            _encode_cursor(items[-1].created_at, items[-1].id)
+            if len(rows) > limit
+            else None
+        ),
+    )
 
 
-@router.get("/{conversation_id}/messages", response_model=list[MessageResponse])
+@router.get("/{conversation_id}/messages", response_model=MessagePage)
 async def get_messages(
     conversation_id: uuid.UUID,
     session: Annotated[SQLModelAsyncSession, Depends(get_session)],
-    current_user: Annotated[User, Depends(get_current_user)],
-) -> list[MessageResponse]:
-    """Get all messages in a conversation."""
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    after: str | None = None,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+) -> MessagePage:
+    """Get the messages in a conversation, oldest first.
+
+    Keyset-paginated: pass the previous page's ``next_cursor`` as *after*
+    to fetch the messages created after it.
+    """
     # Verify ownership
     result = await session.exec(
-        select(Conversation).where(
+        select(Conversation.id)
+        .where(
             Conversation.id == conversation_id,
             Conversation.user_id == current_user.id,
         )
+        .limit(1)
     )
     if result.first() is None:
         raise HTTPException(
@@ -106,20 +155,38 @@ async def get_messages(
             detail="Conversation not found",
         )
 
-    msg_result = await session.exec(
+    query = (
         select(Message)
         .where(Message.conversation_id == conversation_id)
-        .order_by(Message.created_at.asc())  # type: ignore[union-attr]
+        .order_by(
+            Message.created_at.asc(),  # type: ignore[union-attr]
+            Message.id.asc(),  # type: ignore[union-attr]
+        )
+        .limit(limit + 1)  # one extra row tells us whether a next page exists
     )
-    return [
+    if after is not None:
+        query = query.where(
+            tuple_(Message.created_at, Message.id) > tuple_(*_decode_cursor(after))
+        )
+
+    rows = (await session.exec(query)).all()
+    items = [
         MessageResponse(
-            id=str(m.id),
+            id=m.id,
             role=m.role,
             content=m.content,
-            created_at=m.created_at.isoformat(),
+            created_at=m.created_at,
         )
-        for m in msg_result.all()
+        for m in rows[:limit]
     ]
+    return MessagePage(
+        items=items,
+        next_cursor=(
+            _encode_cursor(items[-1].created_at, items[-1].id)
+            if len(rows) > limit
+            else None
+        ),
+    )
 
 
 @router.post(
@@ -131,15 +198,17 @@ async def add_message(
     conversation_id: uuid.UUID,
     body: MessageCreate,
     session: Annotated[SQLModelAsyncSession, Depends(get_session)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
 ) -> MessageResponse:
     """Add a message to a conversation."""
     # Verify ownership
     result = await session.exec(
-        select(Conversation).where(
+        select(Conversation.id)
+        .where(
             Conversation.id == conversation_id,
             Conversation.user_id == current_user.id,
         )
+        .limit(1)
     )
     if result.first() is None:
         raise HTTPException(
@@ -156,8 +225,35 @@ async def add_message(
     await session.commit()
     await session.refresh(msg)
     return MessageResponse(
-        id=str(msg.id),
+        id=msg.id,
         role=msg.role,
         content=msg.content,
-        created_at=msg.created_at.isoformat(),
+        created_at=msg.created_at,
     )
+
+
+# ── Private helpers ──────────────────────────────────────────────
+
+
+def _encode_cursor(created_at: datetime, row_id: uuid.UUID) -> str:
+    """Pack a row's ``(created_at, id)`` sort key into an opaque cursor.
+
+    ``id`` breaks ties between rows sharing a timestamp (e.g. messages
+    written in one transaction), so no row is skipped at a page boundary.
+    """
+    raw = f"{created_at.isoformat()}|{row_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    """Unpack a cursor from :func:`_encode_cursor`, or raise 400."""
+    try:
+        created_at, row_id = (
+            base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8").split("|")
+        )
+        return datetime.fromisoformat(created_at), uuid.UUID(row_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor",
+        ) from None
@@ -1,28 +1,48 @@
 """Document management endpoints — upload, list, delete."""
 
+import tempfile
 import uuid
+from collections.abc import Iterable, Iterator
+from datetime import datetime
 from typing import Annotated
 
+import numpy as np
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, status
+from numba import njit
 from pydantic import BaseModel
-from sqlmodel import select
+from sqlmodel import delete, func, insert, select
 from sqlmodel.ext.asyncio.session import AsyncSession as SQLModelAsyncSession
 
-from app.core.deps import get_current_user
+from app.core.deps import CurrentUser, get_current_user
 from app.db.engine import get_session
-from app.db.models import Document, DocumentChunk, User
+from app.db.models import Document, DocumentChunk
+from app.modules.extract import extract_text_async
 
 router = APIRouter(prefix="/documents", tags=["documents"])
 
+_SUPPORTED_CONTENT_TYPES = frozenset(
+    {
+        "application/pdf",
+        "text/markdown",
+        "text/plain",
+    }
+)
+
+# Documents with more chunks than this are bulk-loaded with COPY (asyncpg only)
+_COPY_THRESHOLD = 100
+
+# Upload bytes are copied to a temp file this many at a time
+_UPLOAD_READ_SIZE = 1 << 20  # 1 MiB
+
 
 # ── Schemas ──────────────────────────────────────────────────────
 
 
 class DocumentResponse(BaseModel):
-    id: str
+    id: uuid.UUID
     filename: str
     content_type: str
-    uploaded_at: str
+    uploaded_at: datetime
     chunk_count: int
 
 
@@ -37,7 +57,7 @@ class DocumentResponse(BaseModel):
 async def upload_document(
     file: UploadFile,
     session: Annotated[SQLModelAsyncSession, Depends(get_session)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
 ) -> DocumentResponse:
     """Upload a PDF or Markdown file.
 
@@ -45,19 +65,25 @@ async def upload_document(
     placeholder — the real embedding logic will live in Phase 3's
     ``modules.rag.ingest`` service.
     """
-    if file.content_type not in (
-        "application/pdf",
-        "text/markdown",
-        "text/plain",
-    ):
+    if file.content_type not in _SUPPORTED_CONTENT_TYPES:
         raise HTTPException(
             status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
             detail="Only PDF, Markdown, and plain-text files are supported",
         )
 
-    raw_bytes = await file.read()
-    text_content = _extract_text(raw_bytes, file.content_type or "text/plain")
-    text_chunks = _chunk_text(text_content)
+    # Stream the upload to disk so resident memory stays at one read buffer
+    # and PDF workers can open the file by path instead of receiving bytes.
+    content_type = file.content_type or "text/plain"
+    with tempfile.NamedTemporaryFile() as tmp:
+        while chunk := await file.read(_UPLOAD_READ_SIZE):
+            tmp.write(chunk)
+        tmp.flush()
+
+        text_content = await extract_text_async(tmp.name, content_type)
+    raw_text, spans = _chunk_spans_of(text_content)
+    chunk_count = len(spans)
+    # chunks are decoded lazily, one at a time, as they are written
+    text_chunks = _iter_chunks(raw_text, spans)
 
     doc = Document(
         user_id=current_user.id,
@@ -67,122 +93,215 @@ async def upload_document(
     session.add(doc)
     await session.flush()  # get doc.id
 
-    for idx, chunk in enumerate(text_chunks):
-        session.add(
-            DocumentChunk(
-                document_id=doc.id,
-                content=chunk,
-                chunk_index=idx,
-                # embedding will be filled by Phase 3 ingestion pipeline
-            )
-        )
+    # embedding is left NULL — filled by the Phase 3 ingestion pipeline
+    conn = await session.connection()
+    if chunk_count > _COPY_THRESHOLD and conn.dialect.driver == "asyncpg":
+        await _copy_chunks(session, doc.id, text_chunks)
+    elif chunk_count:
+        await _insert_chunks(session, doc.id, text_chunks)
 
     await session.commit()
     await session.refresh(doc)
 
     return DocumentResponse(
-        id=str(doc.id),
+        id=doc.id,
         filename=doc.filename,
         content_type=doc.content_type,
-        uploaded_at=doc.uploaded_at.isoformat(),
-        chunk_count=len(text_chunks),
+        uploaded_at=doc.uploaded_at,
+        chunk_count=chunk_count,
     )
 
 
 @router.get("/", response_model=list[DocumentResponse])
 async def list_documents(
     session: Annotated[SQLModelAsyncSession, Depends(get_session)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
 ) -> list[DocumentResponse]:
     """Return all documents belonging to the current user."""
     result = await session.exec(
-        select(Document).where(Document.user_id == current_user.id)
-    )
-    docs = result.all()
-    response = []
-    for doc in docs:
-        chunk_result = await session.exec(
-            select(DocumentChunk).where(DocumentChunk.document_id == doc.id)
+        select(
+            Document.id,
+            Document.filename,
+            Document.content_type,
+            Document.uploaded_at,
+            func.count(DocumentChunk.id),
         )
-        chunks = chunk_result.all()
-        response.append(
-            DocumentResponse(
-                id=str(doc.id),
-                filename=doc.filename,
-                content_type=doc.content_type,
-                uploaded_at=doc.uploaded_at.isoformat(),
-                chunk_count=len(chunks),
-            )
+        .join(
+            DocumentChunk,
+            DocumentChunk.document_id == Document.id,
+            isouter=True,
         )
-    return response
+        .where(Document.user_id == current_user.id)
+        .group_by(Document.id)
+    )
+    return [
+        DocumentResponse(
+            id=doc_id,
+            filename=filename,
+            content_type=content_type,
+            uploaded_at=uploaded_at,
+            chunk_count=chunk_count,
+        )
+        for doc_id, filename, content_type, uploaded_at, chunk_count in result.all()
+    ]
 
 
 @router.delete("/{document_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_document(
     document_id: uuid.UUID,
     session: Annotated[SQLModelAsyncSession, Depends(get_session)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
 ) -> None:
     """Delete a document and all its chunks."""
     result = await session.exec(
-        select(Document).where(
+        select(Document.id)
+        .where(
             Document.id == document_id,
             Document.user_id == current_user.id,
         )
+        .limit(1)
     )
-    doc = result.first()
-    if doc is None:
+    if result.first() is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Document not found",
         )
 
-    # delete chunks first
-    chunk_result = await session.exec(
-        select(DocumentChunk).where(DocumentChunk.document_id == document_id)
+    # delete chunks first — one statement, covers tables created before
+    # the FK gained ON DELETE CASCADE
+    await session.exec(
+        delete(DocumentChunk).where(DocumentChunk.document_id == document_id)
     )
-    for chunk in chunk_result.all():
-        await session.delete(chunk)
 
-    await session.delete(doc)
+    await session.exec(delete(Document).where(Document.id == document_id))
     await session.commit()
 
 
 # ── Private helpers ──────────────────────────────────────────────
 
 
-def _extract_text(raw: bytes, content_type: str) -> str:
-    """Extract plaintext from file bytes.
+async def _copy_chunks(
+    session: SQLModelAsyncSession,
+    document_id: uuid.UUID,
+    chunks: Iterable[str],
+) -> None:
+    """Bulk-load *chunks* for a document through asyncpg's COPY protocol.
 
-    Full PDF parsing via pypdf will be added in Phase 3. For now PDFs
-    fall back to a basic decode attempt.
+    Runs on the session's own connection so the rows are part of the
+    current transaction. ``embedding`` is left out of the column list and
+    defaults to NULL until the ingestion pipeline fills it.
     """
-    if content_type == "application/pdf":
-        try:
-            from pypdf import PdfReader
-            import io
+    conn = await session.connection()
+    raw = await conn.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(
+        DocumentChunk.__tablename__,
+        records=(
+            (uuid.uuid4(), document_id, chunk, idx)
+            for idx, chunk in enumerate(chunks)
+        ),
+        columns=["id", "document_id", "content", "chunk_index"],
+    )
 
-            reader = PdfReader(io.BytesIO(raw))
-            return "\n".join(page.extract_text() or "" for page in reader.pages)
-        except Exception:
-            return raw.decode("utf-8", errors="replace")
-    return raw.decode("utf-8", errors="replace")
 
+async def _insert_chunks(
+    session: SQLModelAsyncSession,
+    document_id: uuid.UUID,
+    chunks: Iterable[str],
+) -> None:
+    """Insert *chunks* for a document as one batched executemany INSERT.
 
-def _chunk_text(
+    Used for small documents, where COPY setup isn't worth it, and for
+    every document when the engine runs on a driver other than asyncpg
+    (e.g. ``postgresql+psycopg://``), where ``copy_records_to_table`` isn't
+    available. SQLAlchemy renders the parameter list as multi-row
+    ``VALUES`` batches, so this stays a handful of round-trips.
+    """
+    await session.exec(
+        insert(DocumentChunk),
+        params=[
+            {
+                "id": uuid.uuid4(),
+                "document_id": document_id,
+                "content": chunk,
+                "chunk_index": idx,
+            }
+            for idx, chunk in enumerate(chunks)
+        ],
+    )
+
+
+def _chunk_spans_of(
     text: str,
     chunk_size: int = 512,
     overlap: int = 64,
-) -> list[str]:
-    """Split *text* into overlapping chunks of ~chunk_size words."""
-    words = text.split()
-    if not words:
-        return []
-
-    chunks: list[str] = []
-    start = 0
-    while start < len(words):
-        end = start + chunk_size
-        chunks.append(" ".join(words[start:end]))
-        start = end - overlap
-    return chunks
+) -> tuple[bytes, np.ndarray]:
+    """Locate overlapping chunks of ~chunk_size words in *text*.
+
+    Returns the UTF-8 encoded text and an ``(n_chunks, 2)`` array of byte
+    ranges into it. Word boundaries are found by a compiled kernel, so each
+    chunk is a slice of the original text with its whitespace intact.
+    """
+    if overlap >= chunk_size:
+        raise ValueError("overlap must be smaller than chunk_size")
+
+    raw = text.encode("utf-8")
+    starts, ends = _word_spans(np.frombuffer(raw, dtype=np.uint8))
+    return raw, _chunk_spans(starts, ends, chunk_size, overlap)
+
+
+def _iter_chunks(raw: bytes, spans: np.ndarray) -> Iterator[str]:
+    """Yield the chunk strings for *spans*, decoding one at a time."""
+    for a, b in spans:
+        yield raw[a:b].decode("utf-8")
+
+
+@njit(cache=True)
+def _word_spans(buf: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Return the start/end byte offsets of every word in *buf*.
+
+    A word is a run of bytes other than ASCII whitespace; UTF-8 continuation
+    bytes are all >= 0x80 so multi-byte characters are never split.
+
+    The loop is branchless: every iteration writes a candidate offset and
+    only advances the counters on a word edge, so real text (with
+    unpredictable word lengths) doesn't pay for branch mispredictions.
+    """
+    n = buf.shape[0]
+    starts = np.empty(n // 2 + 1, dtype=np.int64)
+    ends = np.empty(n // 2 + 2, dtype=np.int64)
+    n_starts = 0
+    n_ends = 0
+    prev = 0
+    for i in range(n):
+        b = buf[i]
+        cur = np.int64((b != 0x20) & ((b < 0x09) | (b > 0x0D)))
+        starts[n_starts] = i
+        n_starts += cur & (1 - prev)
+        ends[n_ends] = i
+        n_ends += prev & (1 - cur)
+        prev = cur
+    ends[n_ends] = n  # close a word that runs to the end of the buffer
+    n_ends += prev
+    return starts[:n_starts], ends[:n_ends]
+
+
+@njit(cache=True)
+def _chunk_spans(
+    starts: np.ndarray,
+    ends: np.ndarray,
+    chunk_size: int,
+    overlap: int,
+) -> np.ndarray:
+    """Group word spans into overlapping ``(start_byte, end_byte)`` ranges."""
+    n_words = starts.shape[0]
+    step = chunk_size - overlap
+    spans = np.empty((n_words // step + 1, 2), dtype=np.int64)
+    count = 0
+    first = 0
+    while first < n_words:
+        last = min(first + chunk_size, n_words) - 1
+        spans[count, 0] = starts[first]
+        spans[count, 1] = ends[last]
+        count += 1
+        first += step
+    return spans[:count]
@@ -1,17 +1,23 @@
 """LiveKit token generation endpoint."""
 
+from datetime import timedelta
 from typing import Annotated
 
 from fastapi import APIRouter, Depends
 from livekit.api import AccessToken, VideoGrants
 from pydantic import BaseModel
 
+from app.core.cache import cache
 from app.core.config import settings
-from app.core.deps import get_current_user
-from app.db.models import User
+from app.core.deps import CurrentUser, get_current_user
 
 router = APIRouter(prefix="/livekit", tags=["livekit"])
 
+# Lifetime of issued participant tokens (LiveKit's own default)
+TOKEN_TTL = timedelta(hours=6)
+# A cached token is only served while at least this much lifetime remains
+TOKEN_MIN_REMAINING = timedelta(hours=1)
+
 
 class TokenRequest(BaseModel):
     room_name: str = "default-room"
@@ -25,11 +31,21 @@ class TokenResponse(BaseModel):
 @router.post("/token", response_model=TokenResponse)
 async def generate_livekit_token(
     body: TokenRequest,
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
 ) -> TokenResponse:
-    """Generate a LiveKit participant token for the authenticated user."""
+    """Generate a LiveKit participant token for the authenticated user.
+
+    Signed tokens are cached per (user, room) so reconnects and polling
+    reuse the same token instead of re-signing one on every call.
+    """
+    cache_key = f"lk:{current_user.id}:{body.room_name}"
+    cached = await cache.get(cache_key)
+    if cached is not None:
+        return TokenResponse(token=cached, url=settings.livekit_url)
+
     token = (
         AccessToken(settings.livekit_api_key, settings.livekit_api_secret)
+        .with_ttl(TOKEN_TTL)
         .with_identity(str(current_user.id))
         .with_name(current_user.email)
         .with_grants(
@@ -39,7 +55,13 @@ async def generate_livekit_token(
             )
         )
     )
+    jwt_str = token.to_jwt()
+    await cache.set(
+        cache_key,
+        jwt_str,
+        int((TOKEN_TTL - TOKEN_MIN_REMAINING).total_seconds()),
+    )
     return TokenResponse(
-        token=token.to_jwt(),
+        token=jwt_str,
         url=settings.livekit_url,
     )
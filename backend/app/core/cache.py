@@ -0,0 +1,61 @@
+"""Redis cache — thin async JSON get/set wrapper around redis-py."""
+
+import json
+import logging
+from typing import Any
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+
+logger = logging.getLogger("app.cache")
+
+
+class RedisCache:
+    """Cache-aside helper.
+
+    Redis failures are logged and treated as a miss so that a cache outage
+    degrades to the uncached path instead of failing the request.
+    """
+
+    def __init__(self, url: str) -> None:
+        self._redis = Redis.from_url(url, decode_responses=True)
+
+    async def get(self, key: str) -> str | None:
+        """Return the raw value stored at *key*, or ``None``."""
+        try:
+            return await self._redis.get(key)
+        except RedisError as exc:
+            logger.warning("Redis GET %s failed: %s", key, exc)
+            return None
+
+    async def set(self, key: str, value: str, ttl: int) -> None:
+        """Store *value* at *key* for *ttl* seconds."""
+        try:
+            await self._redis.set(key, value, ex=ttl)
+        except RedisError as exc:
+            logger.warning("Redis SET %s failed: %s", key, exc)
+
+    async def get_json(self, key: str) -> Any | None:
+        """Return the JSON-decoded value stored at *key*, or ``None``."""
+        raw = await self.get(key)
+        return None if raw is None else json.loads(raw)
+
+    async def set_json(self, key: str, value: Any, ttl: int) -> None:
+        """JSON-encode *value* and store it at *key* for *ttl* seconds."""
+        await self.set(key, json.dumps(value), ttl)
+
+    async def delete(self, key: str) -> None:
+        """Remove *key* from the cache."""
+        try:
+            await self._redis.delete(key)
+        except RedisError as exc:
+            logger.warning("Redis DEL %s failed: %s", key, exc)
+
+    async def close(self) -> None:
+        """Close the underlying connection pool."""
+        await self._redis.aclose()
+
+
+cache = RedisCache(settings.redis_url)
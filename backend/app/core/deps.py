@@ -1,24 +1,46 @@
 """Auth dependencies — get current user from JWT."""
 
+import time
 import uuid
+from datetime import datetime
 from typing import Annotated
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
+from pydantic import BaseModel, ConfigDict
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession as SQLModelAsyncSession
 
+from app.core.cache import cache
 from app.core.security import decode_access_token
 from app.db.engine import get_session
 from app.db.models import User
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
+# Upper bound on how long a cached user row may be served
+USER_CACHE_TTL_SECONDS = 300
+
+
+class CurrentUser(BaseModel):
+    """The authenticated user, as seen by endpoints.
+
+    A plain snapshot of the ``users`` row rather than the ORM object, so a
+    cache hit and a database hit return the same thing — no session, no
+    relationships, and no password hash.
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: uuid.UUID
+    email: str
+    created_at: datetime
+
 
 async def get_current_user(
     token: Annotated[str, Depends(oauth2_scheme)],
     session: Annotated[SQLModelAsyncSession, Depends(get_session)],
-) -> User:
+) -> CurrentUser:
     """Decode JWT and return the authenticated user, or raise 401."""
     payload = decode_access_token(token)
     if payload is None:
@@ -35,6 +57,12 @@ async def get_current_user(
             detail="Token missing subject",
         )
 
+    # v2: entries no longer carry hashed_password and now include created_at
+    cache_key = f"user:v2:{user_id}"
+    cached = await cache.get_json(cache_key)
+    if cached is not None:
+        return CurrentUser.model_validate(cached)
+
     result = await session.exec(select(User).where(User.id == uuid.UUID(user_id)))
     user = result.first()
     if user is None:
@@ -42,4 +70,10 @@ async def get_current_user(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found",
         )
-    return user
+
+    current_user = CurrentUser.model_validate(user)
+    # never cache past the token's own expiry
+    ttl = min(int(payload["exp"] - time.time()), USER_CACHE_TTL_SECONDS)
+    if ttl > 0:
+        await cache.set_json(cache_key, current_user.model_dump(mode="json"), ttl)
+    return current_user
@@ -3,25 +3,46 @@
 from datetime import datetime, timedelta, timezone
 
 import bcrypt
-from jose import JWTError, jwt
+import jwt
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
 
 from app.core.config import settings
 
 # ── Password hashing ─────────────────────────────────────────────
 
+# Argon2id via the argon2-cffi bindings to the reference C implementation.
+_password_hasher = PasswordHasher(
+    time_cost=3,
+    memory_cost=64 * 1024,  # KiB
+    parallelism=4,
+)
+
 
 def hash_password(password: str) -> str:
-    """Return a bcrypt hash of *password*."""
-    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+    """Return an Argon2id hash of *password*."""
+    return _password_hasher.hash(password)
 
 
 def verify_password(plain: str, hashed: str) -> bool:
-    """Check *plain* against a bcrypt *hashed* value."""
-    return bcrypt.checkpw(plain.encode("utf-8"), hashed.encode("utf-8"))
+    """Check *plain* against an Argon2id (or legacy bcrypt) *hashed* value."""
+    if hashed.startswith("$2"):
+        # accounts created before the switch to Argon2id
+        return bcrypt.checkpw(plain.encode("utf-8"), hashed.encode("utf-8"))
+    try:
+        return _password_hasher.verify(hashed, plain)
+    except (VerificationError, InvalidHashError):
+        return False
 
 
 # ── JWT tokens ───────────────────────────────────────────────────
 
+# Resolved once at import so the per-request JWT path skips settings lookups
+_SECRET = settings.secret_key.encode("utf-8")
+_ALGORITHM = settings.algorithm
+_ALGORITHMS = [_ALGORITHM]
+_DEFAULT_EXPIRY = timedelta(minutes=settings.access_token_expire_minutes)
+
 
 def create_access_token(
     data: dict,
@@ -29,16 +50,19 @@ def create_access_token(
 ) -> str:
     """Create a signed JWT containing *data*."""
     to_encode = data.copy()
-    expire = datetime.now(timezone.utc) + (
-        expires_delta or timedelta(minutes=settings.access_token_expire_minutes)
-    )
+    expire = datetime.now(timezone.utc) + (expires_delta or _DEFAULT_EXPIRY)
     to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
+    return jwt.encode(to_encode, _SECRET, algorithm=_ALGORITHM)
 
 
 def decode_access_token(token: str) -> dict | None:
     """Decode and verify a JWT. Returns the payload or ``None``."""
     try:
-        return jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
-    except JWTError:
+        return jwt.decode(
+            token,
+            _SECRET,
+            algorithms=_ALGORITHMS,
+            options={"require": ["exp", "sub"]},
+        )
+    except jwt.InvalidTokenError:
         return None
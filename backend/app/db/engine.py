@@ -2,16 +2,33 @@
 
 from collections.abc import AsyncGenerator
 
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlmodel import SQLModel
 from sqlmodel.ext.asyncio.session import AsyncSession as SQLModelAsyncSession
 
 from app.core.config import settings
 
+# prepared_statement_cache_size is an asyncpg-only connect option — other
+# drivers (e.g. psycopg) reject unknown options on connect
+_connect_args: dict = {}
+if make_url(settings.database_url).get_driver_name() == "asyncpg":
+    _connect_args["prepared_statement_cache_size"] = (
+        settings.db_prepared_statement_cache_size
+    )
+
 engine = create_async_engine(
     settings.database_url,
-    echo=settings.app_debug,
+    echo=settings.sql_echo,
+    echo_pool="debug" if settings.sql_echo_pool else False,
     future=True,
+    # reuse connections instead of paying the connect/auth handshake per request
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_pre_ping=True,
+    pool_recycle=settings.db_pool_recycle,
+    pool_use_lifo=True,
+    connect_args=_connect_args,
 )
 
 
@@ -4,7 +4,7 @@ import uuid
 from datetime import datetime, timezone
 
 from pgvector.sqlalchemy import Vector
-from sqlalchemy import Column, text
+from sqlalchemy import Column, Index, text
 from sqlmodel import Field, Relationship, SQLModel
 
 
@@ -54,14 +54,27 @@ class Document(SQLModel, table=True):
 
     # relationships
     owner: User | None = Relationship(back_populates="documents")
-    chunks: list["DocumentChunk"] = Relationship(back_populates="document")
+    chunks: list["DocumentChunk"] = Relationship(
+        back_populates="document",
+        sa_relationship_kwargs={
+            "cascade": "all, delete-orphan",
+            "passive_deletes": True,
+        },
+    )
 
 
 class DocumentChunk(SQLModel, table=True):
     __tablename__ = "document_chunks"
+    __table_args__ = (
+        Index(
+            "ix_document_chunks_document_id_chunk_index",
+            "document_id",
+            "chunk_index",
+        ),
+    )
 
     id: uuid.UUID = Field(default_factory=_uuid, primary_key=True)
-    document_id: uuid.UUID = Field(foreign_key="documents.id", index=True)
+    document_id: uuid.UUID = Field(foreign_key="documents.id", ondelete="CASCADE")
     content: str
     chunk_index: int = Field(default=0)
     embedding: list[float] | None = Field(
@@ -78,9 +91,14 @@ class DocumentChunk(SQLModel, table=True):
 
 class Conversation(SQLModel, table=True):
     __tablename__ = "conversations"
+    __table_args__ = (
+        Index(
+            "ix_conversations_user_id_created_at_id", "user_id", "created_at", "id"
+        ),
+    )
 
     id: uuid.UUID = Field(default_factory=_uuid, primary_key=True)
-    user_id: uuid.UUID = Field(foreign_key="users.id", index=True)
+    user_id: uuid.UUID = Field(foreign_key="users.id")
     title: str = Field(default="New Conversation", max_length=256)
     created_at: datetime = Field(
         default_factory=_utcnow,
@@ -94,9 +112,17 @@ class Conversation(SQLModel, table=True):
 
 class Message(SQLModel, table=True):
     __tablename__ = "messages"
+    __table_args__ = (
+        Index(
+            "ix_messages_conversation_id_created_at_id",
+            "conversation_id",
+            "created_at",
+            "id",
+        ),
+    )
 
     id: uuid.UUID = Field(default_factory=_uuid, primary_key=True)
-    conversation_id: uuid.UUID = Field(foreign_key="conversations.id", index=True)
+    conversation_id: uuid.UUID = Field(foreign_key="conversations.id")
     role: str = Field(max_length=20)  # "user" | "assistant" | "system"
     content: str
     created_at: datetime = Field(
@@ -0,0 +1,62 @@
+"""Plain-text extraction for uploaded documents.
+
+PDF parsing is CPU-bound and holds the GIL, so PDFs are parsed in a pool of
+worker processes. Workers are started with "spawn" and re-import this module
+before running :func:`extract_text`, so it must stay light: stdlib and
+``pypdf`` only, no app, database or cache imports.
+"""
+
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from pypdf import PdfReader
+
+# Created on first PDF upload; never created inside the workers themselves
+_pdf_executor: ProcessPoolExecutor | None = None
+
+
+def extract_text(path: str, content_type: str) -> str:
+    """Extract plaintext from the file at *path*.
+
+    PDFs that pypdf cannot parse fall back to a basic decode attempt. Must
+    stay a picklable module-level function — PDFs are parsed in the pool.
+    """
+    if content_type == "application/pdf":
+        try:
+            reader = PdfReader(path)
+            return "\n".join(page.extract_text() or "" for page in reader.pages)
+        except Exception:
+            pass
+    with open(path, encoding="utf-8", errors="replace", newline="") as fh:
+        return fh.read()
+
+
+async def extract_text_async(path: str, content_type: str) -> str:
+    """Run :func:`extract_text` off the event loop.
+
+    PDFs go to the worker pool; text formats only need a file read, so a
+    thread is enough.
+    """
+    if content_type != "application/pdf":
+        return await asyncio.to_thread(extract_text, path, content_type)
+
+    global _pdf_executor
+    if _pdf_executor is None:
+        # "spawn" avoids forking a process that already runs threads
+        _pdf_executor = ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return await asyncio.get_running_loop().run_in_executor(
+        _pdf_executor, extract_text, path, content_type
+    )
+
+
+def shutdown_pdf_workers() -> None:
+    """Stop the PDF worker pool, dropping any extractions still queued."""
+    global _pdf_executor
+    if _pdf_executor is not None:
+        _pdf_executor.shutdown(wait=False, cancel_futures=True)
+        _pdf_executor = None
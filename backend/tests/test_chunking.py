@@ -0,0 +1,83 @@
+"""Tests for the compiled document chunker.
+
+The Numba kernels must produce the same word windows as the original
+``str.split()`` chunker, except that non-ASCII whitespace no longer splits
+words.
+"""
+
+import pytest
+
+from app.api.v1.documents import _chunk_spans_of, _iter_chunks
+
+
+def _split_chunks(text: str, chunk_size: int, overlap: int) -> list[list[str]]:
+    """Word windows of the original ``str.split()`` based chunker."""
+    words = text.split()
+    windows: list[list[str]] = []
+    start = 0
+    while start < len(words):
+        windows.append(words[start : start + chunk_size])
+        start += chunk_size - overlap
+    return windows
+
+
+def _chunk_windows(text: str, chunk_size: int, overlap: int) -> list[list[str]]:
+    raw, spans = _chunk_spans_of(text, chunk_size=chunk_size, overlap=overlap)
+    return [chunk.split() for chunk in _iter_chunks(raw, spans)]
+
+
+def _words(n: int) -> str:
+    return " ".join(f"w{i}" for i in range(n))
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        " \t\r\n\v\f ",
+        "single",
+        "  single\n",
+        _words(8),  # exactly chunk_size words
+        _words(9),
+        _words(31),
+        "a b c",  # odd-length buffer
+        " ".join("a" * 99),  # odd length, one-byte words: most words per byte
+        "x" * 7,
+        "\tleading and trailing whitespace \n",
+        "mixed\twhite\nspace\r\nruns   and\fcontrol\vchars",
+        "multi-byte wörds naïve café — 日本語 テキスト",
+    ],
+)
+def test_windows_match_split(text: str) -> None:
+    assert _chunk_windows(text, 8, 3) == _split_chunks(text, 8, 3)
+
+
+def test_windows_match_split_with_defaults() -> None:
+    text = _words(2_000)
+    raw, spans = _chunk_spans_of(text)
+    windows = [chunk.split() for chunk in _iter_chunks(raw, spans)]
+    assert windows == _split_chunks(text, 512, 64)
+
+
+def test_empty_text_has_no_chunks() -> None:
+    raw, spans = _chunk_spans_of("   ")
+    assert spans.shape == (0, 2)
+    assert list(_iter_chunks(raw, spans)) == []
+
+
+def test_chunks_are_slices_of_the_original_text() -> None:
+    text = "one  two\tthree\nfour"
+    raw, spans = _chunk_spans_of(text, chunk_size=3, overlap=1)
+    assert list(_iter_chunks(raw, spans)) == ["one  two\tthree", "three\nfour"]
+
+
+@pytest.mark.parametrize("space", ["\xa0", "\u3000"])
+def test_non_ascii_whitespace_does_not_split_words(space: str) -> None:
+    text = f"left{space}right other"
+    raw, spans = _chunk_spans_of(text, chunk_size=1, overlap=0)
+    assert list(_iter_chunks(raw, spans)) == [f"left{space}right", "other"]
+
+
+def test_overlap_must_be_smaller_than_chunk_size() -> None:
+    with pytest.raises(ValueError):
+        _chunk_spans_of("some text", chunk_size=4, overlap=4)
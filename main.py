@@ -5,9 +5,12 @@ from collections.abc import AsyncIterator
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.api.v1.router import router as v1_router
+from app.core.cache import cache
 from app.db.engine import init_db
+from app.modules.extract import shutdown_pdf_workers
 
 
 @asynccontextmanager
@@ -23,6 +26,8 @@ async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
         logger.warning("Could not connect to database on startup: %s", exc)
         logger.warning("The server will start, but DB-dependent endpoints will fail.")
     yield
+    await cache.close()
+    shutdown_pdf_workers()
 
 
 app = FastAPI(
@@ -30,6 +35,7 @@ app = FastAPI(
     description="Voice-native Agentic RAG system",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # ── CORS ─────────────────────────────────────────────────────────